@@ -37,7 +37,7 @@ class InstantTesting(object):
         On the first run:
             - initialise Spark Context as usual;
             - write Python gateway port to the lock file;
-            - fork current process.
+            - spawn a background process that keeps the JVM alive after the current one exits.
 
         On the second run:
             - connect to the background JVM process using Python gateway port from the lock file;
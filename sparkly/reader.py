@@ -14,19 +14,43 @@
 # limitations under the License.
 #
 
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import json
+from urllib.parse import parse_qsl, urlsplit
 
 from pyspark.sql import functions as F
 
 from sparkly.exceptions import InvalidArgumentError
-from sparkly.utils import kafka_get_topics_offsets
+from sparkly.utils import parse_schema
 
-try:
-    from urllib.parse import urlparse, parse_qsl
-except ImportError:
-    from urlparse import urlparse, parse_qsl
 
-from sparkly.utils import parse_schema
+_CASSANDRA_FETCH_SIZE_OPTIONS = (
+    'spark.cassandra.input.fetch.size_in_rows',  # connector 2.x, an alias in 3.x
+    'spark.cassandra.input.fetch.sizeInRows',  # connector 3.x
+)
+_CASSANDRA_DEFAULT_FETCH_SIZE = '5000'
+
+# Query string arguments of `SparklyReader.by_url` shared by all readers, with their types
+_QUERY_STRING_TYPES = {
+    'parallelism': int,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_url(url):
+    """Parse data source URL, memoizing the result for repeated URLs.
+
+    Args:
+        url (str): Data source URL.
+
+    Returns:
+        (urllib.parse.SplitResult, tuple[(str, str)]): Parsed URL and its query string items.
+    """
+    # `urlsplit` skips the `;params` pass of `urlparse`, which never applies
+    # to the schemes supported by `by_url` anyway
+    parsed_url = urlsplit(url)
+    return parsed_url, tuple(parse_qsl(parsed_url.query))
 
 
 class SparklyReader(object):
@@ -95,12 +119,13 @@ class SparklyReader(object):
         Returns:
             pyspark.sql.DataFrame
         """
-        parsed_url = urlparse(url)
-        parsed_qs = dict(parse_qsl(parsed_url.query))
+        parsed_url, qs_items = _parse_url(url)
+        # resolvers pop items out of the dict, so it must not be shared between calls
+        parsed_qs = dict(qs_items)
 
-        # Used across all readers
-        if 'parallelism' in parsed_qs:
-            parsed_qs['parallelism'] = int(parsed_qs['parallelism'])
+        for key, to_type in _QUERY_STRING_TYPES.items():
+            if key in parsed_qs:
+                parsed_qs[key] = to_type(parsed_qs[key])
 
         try:
             resolver = getattr(self, '_resolve_{}'.format(parsed_url.scheme))
@@ -109,6 +134,35 @@ class SparklyReader(object):
         else:
             return resolver(parsed_url, parsed_qs)
 
+    def by_urls(self, urls, max_workers=None):
+        """Create dataframes for several `urls` at once.
+
+        Each url is resolved with :meth:`by_url`. Resolving a data source usually means
+        waiting on the JVM for metadata discovery and schema inference, so urls are
+        resolved concurrently in a thread pool rather than one after another.
+
+        Example::
+
+            users, events = spark.read_ext.by_urls([
+                'mysql://mysql.host/database/users',
+                'parquet:s3://some-bucket/events',
+            ])
+
+        Args:
+            urls (list[str]): Data source URLs.
+            max_workers (int|None): The max number of urls to resolve at the same time,
+                defaults to ``min(len(urls), 8)``.
+
+        Returns:
+            list[pyspark.sql.DataFrame]: Dataframes in the same order as `urls`.
+        """
+        urls = list(urls)
+        if not urls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max_workers or min(len(urls), 8)) as executor:
+            return list(executor.map(self.by_url, urls))
+
     def cassandra(self, host, keyspace, table, consistency=None, port=None,
                   parallelism=None, options=None):
         """Create a dataframe from a Cassandra table.
@@ -140,6 +194,17 @@ class SparklyReader(object):
         if port:
             reader_options['spark.cassandra.connection.port'] = str(port)
 
+        # The connector pages through token ranges 1000 rows at a time by default,
+        # which makes reads of wide tables latency bound. Keep it overridable via
+        # `options` and don't shadow a value configured for the whole session.
+        # Note: pyspark 2.x treats a `None` default as no default and raises if
+        # the key is unset, hence the empty string.
+        if not any(
+            name in (options or {}) or self._spark.conf.get(name, '')
+            for name in _CASSANDRA_FETCH_SIZE_OPTIONS
+        ):
+            reader_options[_CASSANDRA_FETCH_SIZE_OPTIONS[0]] = _CASSANDRA_DEFAULT_FETCH_SIZE
+
         return self._basic_read(reader_options, options, parallelism)
 
     def elastic(self, host, es_index, es_type, query='', fields=None, port=None,
@@ -151,7 +216,8 @@ class SparklyReader(object):
             es_index (str): Elastic index.
             es_type (str|None): Elastic type. Deprecated in Elasticsearch 7 but required in below 7
             query (str): Pre-filter es documents, e.g. '?q=views:>10'.
-            fields (list[str]|None): Select only specified fields.
+            fields (list[str]|str|None): Select only specified fields,
+                either a list or a comma-separated string of field names.
             port (int|None) Elastic server port.
             parallelism (int|None): The max number of parallel tasks that could be executed
                 during the read stage (see :ref:`controlling-the-load`).
@@ -170,18 +236,27 @@ class SparklyReader(object):
         }
 
         if fields:
-            reader_options['es.read.field.include'] = ','.join(fields)
+            reader_options['es.read.field.include'] = (
+                fields if isinstance(fields, str) else ','.join(fields)
+            )
 
         if port:
             reader_options['es.port'] = str(port)
 
         return self._basic_read(reader_options, options, parallelism)
 
-    def mysql(self, host, database, table, port=None, parallelism=None, options=None):
+    def mysql(self, host, database, table, port=None, parallelism=None, options=None,
+              partition_column=None, lower_bound=None, upper_bound=None, num_partitions=None,
+              predicates=None):
         """Create a dataframe from a MySQL table.
 
         Options should include user and password.
 
+        By default the table is read by a single task. To split the read across
+        the cluster either specify `partition_column` together with `lower_bound`,
+        `upper_bound` and `num_partitions` (the range is divided into equal strides),
+        or pass a list of `predicates` (one task per predicate).
+
         Args:
             host (str): MySQL server address.
             database (str): Database to connect to.
@@ -191,9 +266,20 @@ class SparklyReader(object):
                 during the read stage (see :ref:`controlling-the-load`).
             options (dict[str,str]|None): Additional options for JDBC reader
                 (see configuration for :ref:`mysql`).
+            partition_column (str|None): Numeric, date or timestamp column to split the read by.
+            lower_bound (int|str|None): Minimum value of `partition_column` used to decide
+                the partition stride.
+            upper_bound (int|str|None): Maximum value of `partition_column` used to decide
+                the partition stride.
+            num_partitions (int|None): The number of partitions to split the read into
+                by `partition_column`.
+            predicates (list[str]|None): SQL conditions, each of them defines one partition.
 
         Returns:
             pyspark.sql.DataFrame
+
+        Raises:
+            InvalidArgumentError
         """
         reader_options = {
             'format': 'jdbc',
@@ -206,6 +292,47 @@ class SparklyReader(object):
             'dbtable': table,
         }
 
+        if predicates:
+            if any(arg is not None for arg in
+                   (partition_column, lower_bound, upper_bound, num_partitions)):
+                raise InvalidArgumentError(
+                    'predicates can not be used together with partition_column, '
+                    'lower_bound, upper_bound or num_partitions'
+                )
+        elif partition_column is not None:
+            if None in (lower_bound, upper_bound, num_partitions):
+                raise InvalidArgumentError(
+                    'partition_column requires lower_bound, upper_bound and num_partitions'
+                )
+            reader_options.update({
+                'partitionColumn': partition_column,
+                'lowerBound': str(lower_bound),
+                'upperBound': str(upper_bound),
+                'numPartitions': str(num_partitions),
+            })
+        elif lower_bound is not None or upper_bound is not None:
+            raise InvalidArgumentError('lower_bound and upper_bound require partition_column')
+        elif num_partitions is not None:
+            raise InvalidArgumentError('num_partitions requires partition_column')
+
+        if predicates:
+            # java.util.Properties only takes strings, unlike options of `load`
+            properties = {'driver': reader_options['driver']}
+            properties.update({
+                key: str(value) for key, value in (options or {}).items()
+            })
+
+            df = self._spark.read.jdbc(
+                url=reader_options['url'],
+                table=table,
+                predicates=predicates,
+                properties=properties,
+            )
+            if parallelism:
+                df = df.coalesce(parallelism)
+
+            return df
+
         return self._basic_read(reader_options, options, parallelism)
 
     def kafka(self,
@@ -240,7 +367,11 @@ class SparklyReader(object):
             value_deserializer (function): Function used to deserialize the value.
             schema (pyspark.sql.types.StructType): Schema to apply to create a Dataframe.
             port (int): Kafka port.
-            options (dict|None): Additional kafka parameters, see KafkaUtils.createRDD docs.
+            parallelism (int|None): The max number of parallel tasks that could be executed
+                during the read stage (see :ref:`controlling-the-load`).
+                Partitions are only ever coalesced, never shuffled to a larger number.
+            options (dict|None): Additional options for Spark's `kafka` source,
+                see the Structured Streaming + Kafka Integration Guide.
             include_meta_cols (bool|None): If true, also return "metadata" columns
                 like offset, topic, etc.
 
@@ -259,24 +390,20 @@ class SparklyReader(object):
             .option('subscribe', ','.join(topic))
         )
 
-        def get_offsets(offsets, which):
-            return {
-                offset[0]: offset[which]
-                for offset in offsets
-            }
-
         if offset_ranges:
             if len(topic) > 1:
                 raise InvalidArgumentError(
                     'Specifying offset_ranges for multiple topics is not currently supported; '
                     'please specify options "startingOffsets" and "endingOffsets" manually'
                 )
-            starting_offsets = json.dumps({t: get_offsets(offset_ranges, 1) for t in topic})
-            ending_offsets = json.dumps({t: get_offsets(offset_ranges, 2) for t in topic})
+            starting_offsets, ending_offsets = {}, {}
+            for partition, start_offset, end_offset in offset_ranges:
+                starting_offsets[partition] = start_offset
+                ending_offsets[partition] = end_offset
             reader = (
                 reader
-                .option('startingOffsets',  starting_offsets)
-                .option('endingOffsets', ending_offsets)
+                .option('startingOffsets', json.dumps({topic[0]: starting_offsets}))
+                .option('endingOffsets', json.dumps({topic[0]: ending_offsets}))
             )
 
         for key, value in (options or {}).items():
@@ -325,17 +452,24 @@ class SparklyReader(object):
     def _basic_read(self, reader_options, additional_options, parallelism):
         reader_options.update(additional_options or {})
 
+        # `spark.read` gives a new DataFrameReader on purpose: readers accumulate
+        # format/options, so a shared one would leak them between reads.
         df = self._spark.read.load(**reader_options)
+        # `parallelism` is an upper bound (see "Controlling the load" docs). `coalesce`
+        # is a no-op when it exceeds the current number of partitions, so there is
+        # no need to plan the dataframe just to compare partition counts.
         if parallelism:
             df = df.coalesce(parallelism)
 
         return df
 
     def _resolve_cassandra(self, parsed_url, parsed_qs):
+        path_segments = parsed_url.path.split('/')
+
         return self.cassandra(
             host=parsed_url.hostname,
-            keyspace=parsed_url.path.split('/')[1],
-            table=parsed_url.path.split('/')[2],
+            keyspace=path_segments[1],
+            table=path_segments[2],
             consistency=parsed_qs.pop('consistency', None),
             port=parsed_url.port,
             parallelism=parsed_qs.pop('parallelism', None),
@@ -354,7 +488,7 @@ class SparklyReader(object):
         )
 
         if parallelism:
-            df = df.coalesce(int(parallelism))
+            df = df.coalesce(parallelism)
 
         return df
 
@@ -365,7 +499,7 @@ class SparklyReader(object):
             kwargs['query'] = '?q={}'.format(parsed_qs.pop('q'))
 
         if 'fields' in parsed_qs:
-            kwargs['fields'] = parsed_qs.pop('fields').split(',')
+            kwargs['fields'] = parsed_qs.pop('fields')
 
         path_segments = parsed_url.path.split('/')
 
@@ -380,10 +514,12 @@ class SparklyReader(object):
         )
 
     def _resolve_mysql(self, parsed_url, parsed_qs):
+        path_segments = parsed_url.path.split('/')
+
         return self.mysql(
             host=parsed_url.hostname,
-            database=parsed_url.path.split('/')[1],
-            table=parsed_url.path.split('/')[2],
+            database=path_segments[1],
+            table=path_segments[2],
             port=parsed_url.port,
             parallelism=parsed_qs.pop('parallelism', None),
             options=parsed_qs,
@@ -391,23 +527,18 @@ class SparklyReader(object):
 
     def _resolve_parquet(self, parsed_url, parsed_qs):
         parallelism = parsed_qs.pop('parallelism', None)
+        reader_options = {
+            'path': parsed_url.path,
+            'format': parsed_url.scheme,
+        }
 
-        df = self._spark.read.load(
-            path=parsed_url.path,
-            format=parsed_url.scheme,
-            **parsed_qs
-        )
-
-        if parallelism:
-            df = df.coalesce(int(parallelism))
-
-        return df
+        return self._basic_read(reader_options, parsed_qs, parallelism)
 
     def _resolve_table(self, parsed_url, parsed_qs):
         df = self._spark.table(parsed_url.netloc)
 
         parallelism = parsed_qs.pop('parallelism', None)
         if parallelism:
-            df = df.coalesce(int(parallelism))
+            df = df.coalesce(parallelism)
 
         return df
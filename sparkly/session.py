@@ -17,7 +17,7 @@
 import atexit
 from copy import deepcopy
 import os
-import signal
+import subprocess
 import sys
 import time
 import uuid
@@ -155,14 +155,18 @@ class SparklySession(SparkSession):
         if InstantTesting.is_activated():
             context = InstantTesting.get_context()
 
-            # It's the first run, so we have to create context and demonise the process.
+            # It's the first run, so we have to create context and keep its JVM alive
+            # after this process exits. The JVM quits once its stdin pipe is closed,
+            # so a tiny detached process holds our end of the pipe open.
             if context is None:
                 context = get_context()
-                session_pid = os.fork()
-                if session_pid == 0:  # Detached process.
-                    signal.pause()
-                else:
-                    InstantTesting.set_context(context, session_pid)
+                gateway_proc = getattr(context._gateway, 'proc', None)
+                session_process = subprocess.Popen(
+                    [sys.executable, '-c', 'import signal; signal.pause()'],
+                    stdin=subprocess.DEVNULL,
+                    pass_fds=(gateway_proc.stdin.fileno(),) if gateway_proc else (),
+                )
+                InstantTesting.set_context(context, session_process.pid)
         else:
             context = get_context()
 
@@ -239,11 +243,13 @@ class SparklySession(SparkSession):
         return ' '.join('--conf "{}={}"'.format(*o) for o in sorted(options.items()))
 
     def _setup_udfs(self):
+        # A new session may reuse the JVM session of a running context (e.g. instant
+        # testing), so the function could be registered already.
         for name, defn in self.udfs.items():
             if isinstance(defn, str):
-                self.sql('create temporary function {} as "{}"'.format(name, defn))
+                self.sql('create or replace temporary function {} as "{}"'.format(name, defn))
             elif isinstance(defn, tuple):
-                self.catalog.registerFunction(name, *defn)
+                self.udf.register(name, *defn)
             else:
                 raise NotImplementedError('Incorrect UDF definition: {}: {}'.format(name, defn))
 
@@ -20,12 +20,6 @@ from itertools import islice
 import os
 import re
 
-try:
-    from kafka import KafkaAdminClient, KafkaConsumer, TopicPartition
-    import kafka.admin
-except ImportError:
-    pass
-
 import pylru
 from pyspark import StorageLevel
 from pyspark.sql import DataFrame
@@ -76,6 +70,9 @@ def kafka_get_topics_offsets(host, topic, port=9092):
     Returns:
         [(int, int, int)]: [(partition, start_offset, end_offset)].
     """
+    # kafka-python is an optional dependency, so it is imported only when needed
+    from kafka import KafkaConsumer, TopicPartition
+
     brokers = ['{}:{}'.format(host, port)]
     consumer = KafkaConsumer(bootstrap_servers=brokers)
     partitions = consumer.partitions_for_topic(topic)
@@ -103,9 +100,12 @@ def kafka_create_topic(host, topic, port=9092, num_partitions=2, replication_fac
         num_partitions (int): Number of topic's partitions.
         replication_factor (int): Number of partition's replicas.
     """
+    from kafka import KafkaAdminClient
+    from kafka.admin import NewTopic
+
     kafka_admin = KafkaAdminClient(bootstrap_servers=f'{host}:{port}')
     kafka_admin.create_topics([
-        kafka.admin.NewTopic(
+        NewTopic(
             name=topic,
             num_partitions=num_partitions,
             replication_factor=replication_factor,
@@ -151,6 +151,47 @@ class SparklyReaderMySQLTest(SparklyGlobalSessionTest):
             {'id': 3, 'name': 'john', 'surname': 'ku', 'age': 333},
         ])
 
+    def test_read_mysql_partitioned(self):
+        df = self.spark.read_ext.mysql(
+            host='mysql.docker',
+            database='sparkly_test',
+            table='test',
+            options={
+                'user': 'root',
+                'password': '',
+            },
+            partition_column='id',
+            lower_bound=1,
+            upper_bound=4,
+            num_partitions=3,
+        )
+
+        self.assertEqual(df.rdd.getNumPartitions(), 3)
+        self.assertDataFrameEqual(df, [
+            {'id': 1, 'name': 'john', 'surname': 'sk', 'age': 111},
+            {'id': 2, 'name': 'john', 'surname': 'po', 'age': 222},
+            {'id': 3, 'name': 'john', 'surname': 'ku', 'age': 333},
+        ])
+
+    def test_read_mysql_by_predicates(self):
+        df = self.spark.read_ext.mysql(
+            host='mysql.docker',
+            database='sparkly_test',
+            table='test',
+            options={
+                'user': 'root',
+                'password': '',
+            },
+            predicates=['age < 200', 'age >= 200'],
+        )
+
+        self.assertEqual(df.rdd.getNumPartitions(), 2)
+        self.assertDataFrameEqual(df, [
+            {'id': 1, 'name': 'john', 'surname': 'sk', 'age': 111},
+            {'id': 2, 'name': 'john', 'surname': 'po', 'age': 222},
+            {'id': 3, 'name': 'john', 'surname': 'ku', 'age': 333},
+        ])
+
 
 class TestReaderKafka(SparklyGlobalSessionTest):
     session = SparklyTestSession
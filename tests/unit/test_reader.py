@@ -23,16 +23,21 @@ except ImportError:
 import pyspark.sql
 
 import sparkly
+from sparkly.exceptions import InvalidArgumentError
 from sparkly.reader import SparklyReader
 from sparkly.utils import parse_schema
 
 
-class TestSparklyReaderByUrl(unittest.TestCase):
+class SparklyReaderTestCase(unittest.TestCase):
     def setUp(self):
         self.spark = mock.Mock(spec=sparkly.SparklySession)
+        self.spark.read = mock.Mock(spec=pyspark.sql.DataFrameReader)
         self.read_ext = SparklyReader(self.spark)
         self.fake_df = mock.Mock(spec=pyspark.sql.DataFrame)
 
+
+class TestSparklyReaderByUrl(SparklyReaderTestCase):
+
     def test_table(self):
         self.spark.table.return_value = self.fake_df
 
@@ -41,6 +46,15 @@ class TestSparklyReaderByUrl(unittest.TestCase):
         self.assertEqual(df, self.fake_df)
         self.spark.table.assert_called_with('some_hive_table')
 
+    def test_table_with_parallelism(self):
+        self.spark.table.return_value = self.fake_df
+        self.fake_df.coalesce.return_value = self.fake_df
+
+        df = self.read_ext.by_url('table://some_hive_table?parallelism=2')
+
+        self.assertEqual(df, self.fake_df)
+        self.fake_df.coalesce.assert_called_with(2)
+
     def test_parquet(self):
         self.spark.read.load.return_value = self.fake_df
 
@@ -90,7 +104,7 @@ class TestSparklyReaderByUrl(unittest.TestCase):
             es_index='test_index',
             es_type='test_type',
             query='?q=name:*Johnny*',
-            fields=['name', 'surname'],
+            fields='name,surname',
             port=None,
             parallelism=4,
             options={'es.input.json': 'true'},
@@ -109,7 +123,7 @@ class TestSparklyReaderByUrl(unittest.TestCase):
             es_index='test_index',
             es_type=None,
             query='?q=name:*Johnny*',
-            fields=['name', 'surname'],
+            fields='name,surname',
             port=None,
             parallelism=4,
             options={'es.input.json': 'true'},
@@ -181,5 +195,256 @@ class TestSparklyReaderByUrl(unittest.TestCase):
             options={'user': 'root', 'password': 'pass'},
         )
 
+    def test_same_url_twice(self):
+        self.read_ext.cassandra = mock.Mock(return_value=self.fake_df)
+        url = 'cassandra://localhost/test_cf/test_table?consistency=ONE&query.retry.count=2'
+
+        self.read_ext.by_url(url)
+        self.read_ext.by_url(url)
+
+        self.assertEqual(self.read_ext.cassandra.call_count, 2)
+        self.read_ext.cassandra.assert_called_with(
+            host='localhost',
+            port=None,
+            keyspace='test_cf',
+            table='test_table',
+            consistency='ONE',
+            parallelism=None,
+            options={'query.retry.count': '2'},
+        )
+
+    def test_by_urls(self):
+        self.spark.table.side_effect = lambda name: {
+            'table_a': mock.sentinel.df_a,
+            'table_b': mock.sentinel.df_b,
+        }[name]
+
+        dfs = self.read_ext.by_urls(['table://table_a', 'table://table_b'])
+
+        self.assertEqual(dfs, [mock.sentinel.df_a, mock.sentinel.df_b])
+
+    def test_by_urls_empty(self):
+        self.assertEqual(self.read_ext.by_urls([]), [])
+
+    def test_by_urls_unknown_format(self):
+        self.spark.table.return_value = self.fake_df
+
+        with self.assertRaises(NotImplementedError):
+            self.read_ext.by_urls(['table://some_hive_table', 'fake://host'])
+
+    def test_overridden_resolver(self):
+        class _Reader(SparklyReader):
+            def _resolve_table(self, parsed_url, parsed_qs):
+                return parsed_url.netloc
+
+        self.assertEqual(_Reader(self.spark).by_url('table://some_hive_table'), 'some_hive_table')
+
+    def test_subclass_resolver(self):
+        class _Reader(SparklyReader):
+            def _resolve_custom(self, parsed_url, parsed_qs):
+                return parsed_url.netloc, parsed_qs
+
+        self.assertEqual(
+            _Reader(self.spark).by_url('custom://host?parallelism=2'),
+            ('host', {'parallelism': 2}),
+        )
+
     def test_unknown_format(self):
         self.assertRaises(NotImplementedError, self.read_ext.by_url, 'fake://host')
+
+
+class TestSparklyReaderElastic(SparklyReaderTestCase):
+    def test_fields(self):
+        for fields in [['name', 'surname'], 'name,surname']:
+            self.read_ext.elastic('es_host', 'test_index', None, fields=fields)
+
+            self.spark.read.load.assert_called_with(
+                path='test_index',
+                format='org.elasticsearch.spark.sql',
+                **{
+                    'es.nodes': 'es_host',
+                    'es.query': '',
+                    'es.read.metadata': 'true',
+                    'es.read.field.include': 'name,surname',
+                }
+            )
+
+
+class TestSparklyReaderCassandra(SparklyReaderTestCase):
+    def setUp(self):
+        super(TestSparklyReaderCassandra, self).setUp()
+        # behaves like the JVM side: `get` without a default fails on unset keys
+        self.session_conf = {}
+        jconf = mock.Mock()
+        jconf.get.side_effect = lambda key, *default: (
+            self.session_conf[key] if key in self.session_conf or not default else default[0]
+        )
+        self.spark.conf = pyspark.sql.conf.RuntimeConfig(jconf)
+        self.spark.read.load.return_value = self.fake_df
+
+    def test_default_fetch_size(self):
+        df = self.read_ext.cassandra('localhost', 'test_cf', 'test_table')
+
+        self.assertEqual(df, self.fake_df)
+        self.spark.read.load.assert_called_with(
+            format='org.apache.spark.sql.cassandra',
+            keyspace='test_cf',
+            table='test_table',
+            **{
+                'spark.cassandra.connection.host': 'localhost',
+                'spark.cassandra.input.fetch.size_in_rows': '5000',
+            }
+        )
+
+    def test_fetch_size_from_options(self):
+        for option in ['spark.cassandra.input.fetch.size_in_rows',
+                       'spark.cassandra.input.fetch.sizeInRows']:
+            self.read_ext.cassandra('localhost', 'test_cf', 'test_table', options={
+                option: '100',
+            })
+
+            self.spark.read.load.assert_called_with(
+                format='org.apache.spark.sql.cassandra',
+                keyspace='test_cf',
+                table='test_table',
+                **{
+                    'spark.cassandra.connection.host': 'localhost',
+                    option: '100',
+                }
+            )
+
+    def test_fetch_size_from_session(self):
+        for option in ['spark.cassandra.input.fetch.size_in_rows',
+                       'spark.cassandra.input.fetch.sizeInRows']:
+            self.session_conf.clear()
+            self.session_conf[option] = '100'
+
+            self.read_ext.cassandra('localhost', 'test_cf', 'test_table')
+
+            self.spark.read.load.assert_called_with(
+                format='org.apache.spark.sql.cassandra',
+                keyspace='test_cf',
+                table='test_table',
+                **{'spark.cassandra.connection.host': 'localhost'}
+            )
+
+class TestSparklyReaderMysql(SparklyReaderTestCase):
+    def test_partition_column(self):
+        self.spark.read.load.return_value = self.fake_df
+
+        df = self.read_ext.mysql(
+            'localhost', 'test_database', 'test_table',
+            options={'user': 'root'},
+            partition_column='id',
+            lower_bound=1,
+            upper_bound=1000,
+            num_partitions=10,
+        )
+
+        self.assertEqual(df, self.fake_df)
+        self.spark.read.load.assert_called_with(
+            format='jdbc',
+            driver='com.mysql.jdbc.Driver',
+            url='jdbc:mysql://localhost/test_database',
+            dbtable='test_table',
+            partitionColumn='id',
+            lowerBound='1',
+            upperBound='1000',
+            numPartitions='10',
+            user='root',
+        )
+
+    def test_partition_column_without_bounds(self):
+        with self.assertRaises(InvalidArgumentError):
+            self.read_ext.mysql(
+                'localhost', 'test_database', 'test_table',
+                partition_column='id',
+                num_partitions=10,
+            )
+
+    def test_predicates(self):
+        self.spark.read.jdbc.return_value = self.fake_df
+
+        df = self.read_ext.mysql(
+            'localhost', 'test_database', 'test_table',
+            port=33306,
+            options={'user': 'root', 'fetchsize': 1000},
+            predicates=['age < 30', 'age >= 30'],
+        )
+
+        self.assertEqual(df, self.fake_df)
+        self.spark.read.load.assert_not_called()
+        self.spark.read.jdbc.assert_called_with(
+            url='jdbc:mysql://localhost:33306/test_database',
+            table='test_table',
+            predicates=['age < 30', 'age >= 30'],
+            properties={
+                'driver': 'com.mysql.jdbc.Driver',
+                'user': 'root',
+                'fetchsize': '1000',
+            },
+        )
+
+    def test_predicates_with_num_partitions(self):
+        with self.assertRaises(InvalidArgumentError):
+            self.read_ext.mysql(
+                'localhost', 'test_database', 'test_table',
+                num_partitions=10,
+                predicates=['age < 30'],
+            )
+
+    def test_num_partitions_without_partition_column(self):
+        with self.assertRaises(InvalidArgumentError):
+            self.read_ext.mysql(
+                'localhost', 'test_database', 'test_table',
+                num_partitions=10,
+            )
+
+    def test_bounds_without_partition_column(self):
+        with self.assertRaises(InvalidArgumentError):
+            self.read_ext.mysql(
+                'localhost', 'test_database', 'test_table',
+                lower_bound=1,
+                upper_bound=1000,
+            )
+
+    def test_partition_column_and_predicates(self):
+        with self.assertRaises(InvalidArgumentError):
+            self.read_ext.mysql(
+                'localhost', 'test_database', 'test_table',
+                partition_column='id',
+                lower_bound=1,
+                upper_bound=1000,
+                num_partitions=10,
+                predicates=['age < 30'],
+            )
+
+
+class TestSparklyReaderKafka(SparklyReaderTestCase):
+    def setUp(self):
+        super(TestSparklyReaderKafka, self).setUp()
+        self.reader = self.spark.read.format.return_value
+        self.reader.option.return_value = self.reader
+
+    def test_offset_ranges(self):
+        self.read_ext.kafka(
+            'kafka_host',
+            topic='test_topic',
+            offset_ranges=[(0, 10, 20), (1, 5, 15)],
+        )
+
+        self.spark.read.format.assert_called_with('kafka')
+        self.reader.option.assert_has_calls([
+            mock.call('kafka.bootstrap.servers', 'kafka_host:9092'),
+            mock.call('subscribe', 'test_topic'),
+            mock.call('startingOffsets', '{"test_topic": {"0": 10, "1": 5}}'),
+            mock.call('endingOffsets', '{"test_topic": {"0": 20, "1": 15}}'),
+        ])
+
+    def test_offset_ranges_for_multiple_topics(self):
+        with self.assertRaises(InvalidArgumentError):
+            self.read_ext.kafka(
+                'kafka_host',
+                topic=['topic_a', 'topic_b'],
+                offset_ranges=[(0, 10, 20)],
+            )
@@ -22,6 +22,7 @@ except ImportError:
     import mock
 
 from pyspark import SparkContext
+from pyspark.sql.types import IntegerType
 
 from sparkly import SparklySession
 
@@ -250,6 +251,47 @@ class TestSparklySession(unittest.TestCase):
             ),
         })
 
+    @mock.patch('sparkly.session.subprocess.Popen')
+    @mock.patch('sparkly.session.InstantTesting')
+    def test_instant_testing_first_run(self, instant_testing_mock, popen_mock):
+        instant_testing_mock.is_activated.return_value = True
+        instant_testing_mock.get_context.return_value = None
+        context = self.spark_context_mock.return_value
+        context._gateway.proc.stdin.fileno.return_value = 42
+        popen_mock.return_value.pid = 1234
+
+        class _Session(SparklySession):
+            pass
+
+        _Session()
+
+        popen_mock.assert_called_once_with(
+            [sys.executable, '-c', 'import signal; signal.pause()'],
+            stdin=mock.ANY,
+            pass_fds=(42,),
+        )
+        instant_testing_mock.set_context.assert_called_once_with(context, 1234)
+
+    @mock.patch.object(SparklySession, 'udf')
+    @mock.patch.object(SparklySession, 'sql')
+    def test_udfs(self, sql_mock, udf_mock):
+        def my_python_udf(x):
+            return len(x)
+
+        class _Session(SparklySession):
+            udfs = {
+                'collect_max': 'brickhouse.udf.collect.CollectMaxUDAF',
+                'my_python_udf': (my_python_udf, IntegerType()),
+            }
+
+        _Session()
+
+        sql_mock.assert_called_once_with(
+            'create or replace temporary function collect_max '
+            'as "brickhouse.udf.collect.CollectMaxUDAF"'
+        )
+        udf_mock.register.assert_called_once_with('my_python_udf', my_python_udf, IntegerType())
+
     def test_broken_udf(self):
         class _Session(SparklySession):
             udfs = {